@@ -1,5 +1,7 @@
 import os
+import asyncio
 from typing import List, Dict, Any
+import httpx
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
@@ -9,49 +11,113 @@ from langchain_core.agents import AgentAction, AgentFinish
 from langchain.agents import AgentExecutor, create_openai_functions_agent
 from langchain.memory import ConversationBufferMemory
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
+from pydantic import BaseModel, Field
 
 # Load environment variables
 load_dotenv()
 
+# Keep-alive limits for the HTTP connection pool shared by the OpenAI models
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=600)
+
+# Model per stage: only the creative stage needs the larger model,
+# research and synthesis are summarization-style work for the cheap tier
+MODEL_TIERS = {
+    'research': 'claude-haiku-4-5',
+    'creative': 'claude-sonnet-4-5',
+    'analytical': 'gpt-3.5-turbo',
+    'synthesis': 'claude-haiku-4-5'
+}
+
+STAGE_TEMPERATURES = {
+    'research': 0.7,
+    'creative': 0.8,
+    'analytical': 0.2,
+    'synthesis': 0.8
+}
+
+# Output caps sized to what each stage needs; decoding dominates latency.
+# Research also drafts the strategy outline, so it gets extra room.
+STAGE_MAX_TOKENS = {
+    'research': 1000,
+    'creative': 1200,
+    'analytical': 500,
+    'synthesis': 800
+}
+
 class MultiModelCollaborativeAgent:
     def __init__(self):
-        # Initialize different models with specific roles
-        self.research_model = ChatOpenAI(
-            model='gpt-4-turbo',
-            temperature=0.7,
-            api_key=os.getenv('OPENAI_API_KEY')
-        )
-        
-        self.creative_model = ChatAnthropic(
-            model='claude-2.1',
-            temperature=0.8,
-            api_key=os.getenv('ANTHROPIC_API_KEY')
-        )
-        
-        self.analytical_model = ChatOpenAI(
-            model='gpt-3.5-turbo',
-            temperature=0.2,
-            api_key=os.getenv('OPENAI_API_KEY')
-        )
+        # Single connection pool so OpenAI calls reuse TCP/TLS connections
+        self._http = httpx.AsyncClient(limits=HTTP_LIMITS)
+
+        # Models are created on first use, one per stage
+        self._models = {}
+
+    def _model_for(self, stage: str):
+        """Return the model configured for a stage, creating it on first use"""
+        if stage not in self._models:
+            model_name = MODEL_TIERS[stage]
+            if model_name.startswith('claude'):
+                self._models[stage] = ChatAnthropic(
+                    model=model_name,
+                    temperature=STAGE_TEMPERATURES[stage],
+                    max_tokens=STAGE_MAX_TOKENS[stage],
+                    api_key=os.getenv('ANTHROPIC_API_KEY')
+                )
+            else:
+                self._models[stage] = ChatOpenAI(
+                    model=model_name,
+                    temperature=STAGE_TEMPERATURES[stage],
+                    max_tokens=STAGE_MAX_TOKENS[stage],
+                    api_key=os.getenv('OPENAI_API_KEY'),
+                    http_async_client=self._http
+                )
+        return self._models[stage]
+
+    async def aclose(self):
+        """Close the shared HTTP connection pool"""
+        await self._http.aclose()
+
+    class ResearchPlan(BaseModel):
+        """Structured output for the research phase"""
+        research: str = Field(description="Objective analysis with key insights and background context, at most 400 words")
+        synthesis_skeleton: str = Field(description="Outline of the final strategy as at most 8 short headings, to be completed with the proposed solutions and their evaluation")
 
-    def collaborative_problem_solving(self, initial_problem: str):
+    async def collaborative_problem_solving(self, initial_problem: str):
         """
         A multi-stage collaborative problem-solving approach
-        with specialized AI agents working together
+        with specialized AI agents working together.
+        Creative and analytical phases both build on the research
+        and run concurrently before the final synthesis.
+        The research call also drafts the outline of the final strategy,
+        so the synthesis only has to merge the other phases into it.
         """
         # Stage 1: Research and Information Gathering
         research_prompt = ChatPromptTemplate.from_messages([
             SystemMessage(content="""
             You are a meticulous research assistant. 
-            Your task is to gather comprehensive information about the given problem.
-            Provide a detailed, objective analysis with key insights and background context.
+            Your task is to gather the key information about the given problem.
+            Provide a concise, objective analysis of at most 400 words with key insights
+            and background context. Also draft the outline of a final strategy for the
+            problem as at most 8 short headings, leaving room for the solutions and
+            evaluation that other experts will contribute.
             """),
             HumanMessage(content=f"Research and analyze the following problem in depth: {initial_problem}")
         ])
-        research_chain = research_prompt | self.research_model
-        research_output = research_chain.invoke({})
+        research_chain = research_prompt | self._model_for('research').with_structured_output(
+            self.ResearchPlan, include_raw=True
+        )
+        research_result = await research_chain.ainvoke({})
+        research_plan = research_result['parsed']
+        if research_plan is None:
+            # A tool call cut off at the token limit cannot be parsed;
+            # ask for plain-text research and let the synthesis draft its own outline
+            research_output = await (research_prompt | self._model_for('research')).ainvoke({})
+            research_plan = self.ResearchPlan(
+                research=research_output.content,
+                synthesis_skeleton="No outline was drafted; structure the strategy yourself."
+            )
         print("🔬 Research Phase Output:")
-        print(research_output.content)
+        print(research_plan.research)
         print("\n--- Next Phase ---\n")
 
         # Stage 2: Creative Solution Generation
@@ -61,25 +127,29 @@ class MultiModelCollaborativeAgent:
             Using the research insights, generate innovative and unconventional solutions.
             Think outside the box and propose approaches that others might overlook.
             """),
-            HumanMessage(content=f"Generate creative solutions based on this research: {research_output.content}")
+            HumanMessage(content=f"Generate creative solutions based on this research: {research_plan.research}")
         ])
-        creative_chain = creative_prompt | self.creative_model
-        creative_output = creative_chain.invoke({})
-        print("💡 Creative Solutions Phase:")
-        print(creative_output.content)
-        print("\n--- Next Phase ---\n")
+        creative_chain = creative_prompt | self._model_for('creative')
 
         # Stage 3: Analytical Evaluation and Refinement
         analytical_prompt = ChatPromptTemplate.from_messages([
             SystemMessage(content="""
             You are a critical and analytical problem solver.
-            Evaluate the proposed creative solutions rigorously.
+            Evaluate the research findings rigorously.
             Assess feasibility, potential challenges, and provide constructive recommendations.
             """),
-            HumanMessage(content=f"Critically analyze these creative solutions: {creative_output.content}")
+            HumanMessage(content=f"Critically analyze the problem based on this research: {research_plan.research}")
         ])
-        analytical_chain = analytical_prompt | self.analytical_model
-        analytical_output = analytical_chain.invoke({})
+        analytical_chain = analytical_prompt | self._model_for('analytical')
+
+        # Stages 2 and 3 only depend on the research, so run them concurrently
+        creative_output, analytical_output = await asyncio.gather(
+            creative_chain.ainvoke({}),
+            analytical_chain.ainvoke({})
+        )
+        print("💡 Creative Solutions Phase:")
+        print(creative_output.content)
+        print("\n--- Next Phase ---\n")
         print("📊 Analytical Evaluation Phase:")
         print(analytical_output.content)
 
@@ -87,22 +157,23 @@ class MultiModelCollaborativeAgent:
         synthesis_prompt = ChatPromptTemplate.from_messages([
             SystemMessage(content="""
             You are a synthesizer who integrates insights from research, creativity, and analysis.
-            Combine the best elements from each phase into a comprehensive, actionable strategy.
+            Complete the given strategy outline with the best elements from each phase
+            to produce a comprehensive, actionable strategy.
             """),
             HumanMessage(content=f"""
-            Synthesize a final strategy using these inputs:
-            Research Phase: {research_output.content}
+            Complete this strategy outline using the inputs below:
+            Strategy Outline: {research_plan.synthesis_skeleton}
             Creative Solutions: {creative_output.content}
             Analytical Evaluation: {analytical_output.content}
             """)
         ])
-        synthesis_chain = synthesis_prompt | self.creative_model
-        final_strategy = synthesis_chain.invoke({})
+        synthesis_chain = synthesis_prompt | self._model_for('synthesis')
+        final_strategy = await synthesis_chain.ainvoke({})
         print("\n🌟 Final Collaborative Strategy:")
         print(final_strategy.content)
 
         return {
-            'research': research_output.content,
+            'research': research_plan.research,
             'creative_solutions': creative_output.content,
             'analytical_evaluation': analytical_output.content,
             'final_strategy': final_strategy.content
@@ -114,7 +185,13 @@ def main():
     # Example problem: Addressing urban sustainability
     problem = "How can cities become more sustainable and resilient to climate change?"
     
-    collaborative_result = collaborative_agent.collaborative_problem_solving(problem)
+    async def run():
+        try:
+            return await collaborative_agent.collaborative_problem_solving(problem)
+        finally:
+            await collaborative_agent.aclose()
+
+    collaborative_result = asyncio.run(run())
 
 if __name__ == "__main__":
     main()
@@ -4,18 +4,58 @@ from langchain_huggingface import HuggingFacePipeline
 from langchain.prompts import PromptTemplate
 from langchain.schema import HumanMessage, SystemMessage
 from transformers import pipeline
+from typing import List
+import torch
+import httpx
 from dotenv import load_dotenv
 import os
 
 # Load environment variables
 load_dotenv()
 
+# Keep-alive limits for the HTTP connection pool shared by the OpenAI model
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=600)
+
+# Shared gpt2 pipeline, loaded on first use
+_HF_PIPE = None
+
+# Prompts per forward pass when the pipeline is given a list
+HF_BATCH_SIZE = 8
+
+def get_text_generation_pipeline():
+    """
+    Return the process-wide gpt2 text-generation pipeline,
+    using half precision on GPU and bfloat16 on CPU
+    """
+    global _HF_PIPE
+    if _HF_PIPE is None:
+        use_cuda = torch.cuda.is_available()
+        _HF_PIPE = pipeline(
+            'text-generation', 
+            model='gpt2',
+            torch_dtype=torch.float16 if use_cuda else torch.bfloat16,
+            device=0 if use_cuda else -1,
+            max_new_tokens=100,  
+            truncation=True,
+            batch_size=HF_BATCH_SIZE
+        )
+        # gpt2 has no pad token, which batched generation requires, and a
+        # decoder-only model must be padded on the left so each prompt's
+        # continuation starts right after its last real token
+        _HF_PIPE.tokenizer.pad_token_id = _HF_PIPE.model.config.eos_token_id
+        _HF_PIPE.tokenizer.padding_side = 'left'
+    return _HF_PIPE
+
 class CollaborativeLanguageChain:
     def __init__(self):
+        # One connection pool reused by every OpenAI request this chain makes
+        self._http = httpx.Client(limits=HTTP_LIMITS)
+
         # Initialize models
         self.openai_model = ChatOpenAI(
             openai_api_key=os.getenv('OPENAI_API_KEY'), 
-            model='gpt-3.5-turbo'
+            model='gpt-3.5-turbo',
+            http_client=self._http
         )
         self.claude_model = ChatAnthropic(
             anthropic_api_key=os.getenv('ANTHROPIC_API_KEY'), 
@@ -23,13 +63,14 @@ class CollaborativeLanguageChain:
         )
         
         # Hugging Face model for text generation
-        text_generation_pipeline = pipeline(
-            'text-generation', 
-            model='gpt2',
-            max_new_tokens=100,  
-            truncation=True
+        self.huggingface_model = HuggingFacePipeline(
+            pipeline=get_text_generation_pipeline(),
+            batch_size=HF_BATCH_SIZE
         )
-        self.huggingface_model = HuggingFacePipeline(pipeline=text_generation_pipeline)
+
+    def close(self):
+        """Release the shared HTTP connection pool"""
+        self._http.close()
 
     def collaborative_story_generation(self, initial_prompt):
         """
@@ -70,9 +111,44 @@ class CollaborativeLanguageChain:
         print("🤖 Claude Story Refinement:")
         print(final_story.content)
 
+    def collaborative_story_generation_batch(self, prompts: List[str]) -> List[str]:
+        """
+        Run the collaborative story generation for several prompts at once.
+        Each step receives the whole list, so the Hugging Face pipeline
+        generates the expansions in batches instead of one prompt at a time.
+        """
+        openai_prompt = PromptTemplate(
+            input_variables=["topic"],
+            template="Create a concise, imaginative story outline about {topic}."
+        )
+        openai_chain = openai_prompt | self.openai_model
+        story_outlines = openai_chain.batch([{"topic": prompt} for prompt in prompts])
+
+        huggingface_prompt = PromptTemplate(
+            input_variables=["outline"],
+            template="Expand this story outline with creative details: {outline}"
+        )
+        huggingface_chain = huggingface_prompt | self.huggingface_model
+        expanded_stories = huggingface_chain.batch(
+            [{"outline": outline.content} for outline in story_outlines]
+        )
+
+        claude_prompt = PromptTemplate(
+            input_variables=["expanded_story"],
+            template="Review and enhance this story, adding depth and emotional nuance: {expanded_story}"
+        )
+        claude_chain = claude_prompt | self.claude_model
+        final_stories = claude_chain.batch(
+            [{"expanded_story": story} for story in expanded_stories]
+        )
+        return [story.content for story in final_stories]
+
 def main():
     collaborative_chain = CollaborativeLanguageChain()
-    collaborative_chain.collaborative_story_generation("a future where humans and AI coexist")
+    try:
+        collaborative_chain.collaborative_story_generation("a future where humans and AI coexist")
+    finally:
+        collaborative_chain.close()
 
 if __name__ == "__main__":
     main()
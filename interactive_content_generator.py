@@ -1,193 +1,27 @@
-import os
+import queue
 import time
+import concurrent.futures
 import streamlit as st
-from typing import Dict, Any
 from dotenv import load_dotenv
 from loguru import logger
 
-# Langchain and AI imports
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser, StrOutputParser
-from langchain_core.messages import HumanMessage, SystemMessage
-from pydantic import BaseModel, Field
-
-# Code formatting
-import black
-import isort
-import re
-
-# Retry and error handling
-from tenacity import retry, stop_after_attempt, wait_exponential
-import anthropic
-
-# Configure logging
-logger.add("content_generation.log", rotation="10 MB")
-
-class TechContentGenerator:
-    def __init__(self):
-        # Initialize specialized models
-        self.research_model = ChatOpenAI(
-            model='gpt-4-turbo',
-            temperature=0.3,
-            api_key=os.getenv('OPENAI_API_KEY')
-        )
-        
-        self.creative_model = ChatAnthropic(
-            model='claude-2.1',
-            temperature=0.7,
-            api_key=os.getenv('ANTHROPIC_API_KEY')
-        )
-        
-        self.backup_model = ChatGoogleGenerativeAI(
-            model='gemini-pro',
-            temperature=0.5,
-            api_key=os.getenv('GEMINI_API_KEY')
-        )
-        
-        self.code_model = ChatOpenAI(
-            model='gpt-3.5-turbo',
-            temperature=0.2,
-            api_key=os.getenv('OPENAI_API_KEY')
-        )
-
-    class BlogPostStructure(BaseModel):
-        """Structured output for blog post generation"""
-        title: str = Field(description="Catchy and informative blog post title")
-        introduction: str = Field(description="Engaging introduction to the topic")
-        key_sections: list[str] = Field(description="Main sections of the blog post")
-        conclusion: str = Field(description="Summarizing conclusion")
-
-    class CodeExample(BaseModel):
-        """Structured output for code generation"""
-        language: str = Field(description="Programming language for the code")
-        purpose: str = Field(description="Brief description of the code's purpose")
-        code: str = Field(description="Actual code implementation")
-        explanation: str = Field(description="Detailed explanation of the code")
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry_error_callback=lambda retry_state: retry_state.outcome.result()
+from tech_generator import get_generator
+
+# Configure logging. Records are written by a background thread (enqueue=True)
+# so file I/O stays off the event loop; the sink is added once per process
+# rather than on every Streamlit rerun.
+@st.cache_resource(show_spinner=False)
+def configure_logging():
+    return logger.add(
+        "content_generation.log",
+        rotation="10 MB",
+        enqueue=True,
+        serialize=False,
+        backtrace=False,
+        diagnose=False
     )
-    def generate_with_retry(self, model, prompt, max_tokens=1000):
-        """
-        Retry mechanism for model generation with exponential backoff
-        Fallback to alternative models if primary model fails
-        """
-        try:
-            return model.invoke(prompt)
-        except (anthropic.RateLimitError, anthropic.APIError) as e:
-            logger.warning(f"Primary model failed: {e}. Attempting backup model...")
-            try:
-                return self.backup_model.invoke(prompt)
-            except Exception as backup_error:
-                logger.error(f"Backup model also failed: {backup_error}")
-                raise
-
-    def extract_code_block(self, model_output: str) -> str:
-        """
-        Extract code block from model output using multiple strategies
-        """
-        # Strategy 1: Look for triple backtick code blocks
-        code_match = re.search(r'```(?:python)?\n(.*?)```', model_output, re.DOTALL)
-        if code_match:
-            return code_match.group(1).strip()
-        
-        # Strategy 2: Look for code between specific markers
-        code_match = re.search(r'<code>(.*?)</code>', model_output, re.DOTALL)
-        if code_match:
-            return code_match.group(1).strip()
-        
-        # Strategy 3: Use the entire output if it looks like code
-        if model_output.strip().startswith('def ') or model_output.strip().startswith('import '):
-            return model_output.strip()
-        
-        # Fallback: Return a default example
-        return "# No code could be extracted\ndef example_function():\n    pass"
 
-    def generate_technical_content(self, topic: str, progress_callback=None, log_callback=None) -> Dict[str, Any]:
-        """
-        Collaborative process to generate a technical blog post with code example
-        """
-        # Logging helper
-        def log_and_progress(message, percent=None):
-            if log_callback:
-                log_callback(message)
-            if progress_callback and percent is not None:
-                progress_callback(percent, message)
-            logger.info(message)
-
-        # Stage 1: Research and Topic Exploration
-        log_and_progress(f"Starting research phase for topic: {topic}", 0)
-        
-        research_prompt = ChatPromptTemplate.from_messages([
-            SystemMessage(content="You are a technical research expert. Provide comprehensive insights."),
-            HumanMessage(content=f"Research and analyze the technical aspects of: {topic}")
-        ])
-        research_chain = research_prompt | self.research_model
-        blog_structure = self.generate_with_retry(research_chain, {})
-        
-        log_and_progress("Research phase completed", 25)
-
-        # Stage 2: Creative Content Development
-        log_and_progress("Starting creative content development", 25)
-        
-        creative_prompt = ChatPromptTemplate.from_messages([
-            SystemMessage(content="You are a creative technical writer. Develop engaging content."),
-            HumanMessage(content=f"Develop a detailed blog post based on this research: {blog_structure.content}")
-        ])
-        creative_chain = creative_prompt | self.creative_model
-        full_blog_content = self.generate_with_retry(creative_chain, {})
-        
-        log_and_progress("Creative content development completed", 50)
-
-        # Stage 3: Code Example Generation
-        log_and_progress("Starting code example generation", 50)
-        
-        code_prompt = ChatPromptTemplate.from_messages([
-            SystemMessage(content="You are an expert programmer. Generate a practical code example related to the topic."),
-            HumanMessage(content=f"Create a Python code example for this topic: {topic}. Provide a complete, runnable code snippet with comments explaining its purpose and functionality.")
-        ])
-        code_chain = code_prompt | self.code_model | StrOutputParser()
-        code_example_text = self.generate_with_retry(code_chain, {})
-        
-        log_and_progress("Code example generation completed", 75)
-
-        # Stage 4: Code Extraction and Formatting
-        log_and_progress("Extracting and formatting code", 75)
-        
-        def format_code(code: str, language: str = 'python') -> str:
-            """Format and optimize code"""
-            try:
-                if language.lower() == 'python':
-                    formatted_code = black.format_str(code, mode=black.FileMode())
-                    formatted_code = isort.code(formatted_code)
-                    return formatted_code
-                return code
-            except Exception as e:
-                logger.error(f"Code formatting error: {e}")
-                return code
-
-        # Extract code block and format
-        extracted_code = self.extract_code_block(code_example_text)
-        formatted_code = format_code(extracted_code)
-        
-        log_and_progress("Content generation completed", 100)
-
-        # Combine all outputs
-        return {
-            'blog_structure': blog_structure.content,
-            'blog_content': full_blog_content.content,
-            'code_example': {
-                'original': extracted_code,
-                'formatted': formatted_code,
-                'language': 'python',
-                'explanation': 'Code example generated for the given topic'
-            }
-        }
+configure_logging()
 
 def main():
     # Streamlit UI
@@ -220,22 +54,57 @@ def main():
         status_text.text(message)
         update_log(message)
 
+    reuse_cached = st.checkbox("Reuse cached responses for repeated topics", value=False)
+
     # Generation button
     if st.button("Generate Content"):
         if not topic:
             st.error("Please enter a topic")
             return
 
-        # Initialize content generator
-        content_generator = TechContentGenerator()
+        # Shared content generator
+        content_generator = get_generator()
+
+        # Research output is streamed here as it is generated
+        with st.expander("🔬 Research", expanded=True):
+            research_placeholder = st.empty()
+        elapsed_text = st.empty()
+
+        # Callbacks fire on the generator's event loop thread; they are queued
+        # and applied here on the script thread, which owns the page
+        ui_updates = queue.Queue()
+
+        def queued(callback):
+            def wrapper(*args):
+                ui_updates.put((callback, args))
+            return wrapper
+
+        # Generate content with progress tracking
+        gen_task = content_generator.submit(content_generator.generate_technical_content(
+            topic, 
+            progress_callback=queued(update_progress),
+            log_callback=queued(update_log),
+            stream_callback=queued(research_placeholder.markdown),
+            cache_responses=reuse_cached
+        ))
+        started = time.monotonic()
 
         try:
-            # Generate content with progress tracking
-            result = content_generator.generate_technical_content(
-                topic, 
-                progress_callback=update_progress,
-                log_callback=update_log
-            )
+            try:
+                # Streamlit only stops this run for a rerun (e.g. a new click) at an
+                # st.* call, so one is made at least every 0.1s even while no
+                # updates arrive; the finally block then cancels the pipeline,
+                # so abandoned generations stop spending API quota
+                while not (gen_task.done() and ui_updates.empty()):
+                    try:
+                        callback, args = ui_updates.get(timeout=0.1)
+                    except queue.Empty:
+                        elapsed_text.caption(f"Elapsed: {time.monotonic() - started:.0f}s")
+                        continue
+                    callback(*args)
+            finally:
+                gen_task.cancel()
+            result = gen_task.result()
 
             # Display results
             st.subheader("📝 Generated Blog Post")
@@ -261,6 +130,8 @@ def main():
                     mime="text/python"
                 )
 
+        except concurrent.futures.CancelledError:
+            update_log("Generation cancelled")
         except Exception as e:
             st.error(f"An error occurred: {e}")
             logger.error(f"Content generation error: {e}")
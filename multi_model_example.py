@@ -5,11 +5,12 @@ from langchain.prompts import PromptTemplate
 from dotenv import load_dotenv
 import os
 import sys
+import asyncio
 
 # Load environment variables
 load_dotenv()
 
-def openai_example():
+async def openai_example():
     """Example using OpenAI's language model"""
     try:
         openai_llm = OpenAI(openai_api_key=os.getenv('OPENAI_API_KEY'))
@@ -21,39 +22,37 @@ def openai_example():
         
         # Use the new recommended method: prompt | llm
         chain = openai_prompt | openai_llm
-        return chain.invoke({"topic": "artificial intelligence"})
+        return await chain.ainvoke({"topic": "artificial intelligence"})
     except Exception as e:
         print(f"OpenAI example failed: {e}")
         return None
 
-def huggingface_example():
+def _run_huggingface_chain():
+    """Load the shared gpt2 pipeline and run the story prompt through it"""
+    from collaborative_models import get_text_generation_pipeline
+    
+    # Create Langchain wrapper for the shared gpt2 pipeline
+    hf_llm = HuggingFacePipeline(pipeline=get_text_generation_pipeline())
+    
+    # More complex prompt to showcase text generation
+    hf_prompt = PromptTemplate(
+        input_variables=["context"],
+        template="Given the context of {context}, continue the story in an imaginative way."
+    )
+    
+    # Use the new recommended method: prompt | llm
+    chain = hf_prompt | hf_llm
+    
+    # Example context for story continuation
+    story_context = "In a world where robots and humans coexist peacefully"
+    return chain.invoke({"context": story_context})
+
+async def huggingface_example():
     """Advanced example using Hugging Face models with more context"""
     try:
-        from transformers import pipeline
-        
-        # Demonstrate different model capabilities
-        text_generation_pipeline = pipeline(
-            'text-generation', 
-            model='gpt2',  # Small, accessible model
-            max_length=100,
-            truncation=True
-        )
-        
-        # Create Langchain wrapper for Hugging Face pipeline
-        hf_llm = HuggingFacePipeline(pipeline=text_generation_pipeline)
-        
-        # More complex prompt to showcase text generation
-        hf_prompt = PromptTemplate(
-            input_variables=["context"],
-            template="Given the context of {context}, continue the story in an imaginative way."
-        )
-        
-        # Use the new recommended method: prompt | llm
-        chain = hf_prompt | hf_llm
-        
-        # Example context for story continuation
-        story_context = "In a world where robots and humans coexist peacefully"
-        return chain.invoke({"context": story_context})
+        # Importing torch/transformers, loading gpt2 and generating are all blocking,
+        # so they run in a worker thread and the API examples proceed concurrently
+        return await asyncio.to_thread(_run_huggingface_chain)
     except ImportError:
         print("Hugging Face example requires PyTorch or TensorFlow. Install using: pip install torch transformers")
         return None
@@ -61,7 +60,7 @@ def huggingface_example():
         print(f"Hugging Face example failed: {e}")
         return None
 
-def claude_example():
+async def claude_example():
     """Example using Anthropic's Claude model"""
     try:
         claude_llm = ChatAnthropic(
@@ -76,22 +75,30 @@ def claude_example():
         
         # Use the new recommended method: prompt | llm
         chain = claude_prompt | claude_llm
-        return chain.invoke({"topic": "reducing plastic waste in oceans"}).content
+        return (await chain.ainvoke({"topic": "reducing plastic waste in oceans"})).content
     except Exception as e:
         print(f"Claude example failed: {e}")
         return None
 
+async def run_examples():
+    """Run all examples concurrently"""
+    return await asyncio.gather(
+        openai_example(),
+        huggingface_example(),
+        claude_example(),
+        return_exceptions=True
+    )
+
 def main():
+    openai_result, huggingface_result, claude_result = asyncio.run(run_examples())
+
     print("OpenAI Example:")
-    openai_result = openai_example()
     print(openai_result or "No result")
     
     print("\nHugging Face Example:")
-    huggingface_result = huggingface_example()
     print(huggingface_result or "No result")
     
     print("\nClaude Example:")
-    claude_result = claude_example()
     print(claude_result or "No result")
 
 if __name__ == "__main__":
@@ -0,0 +1,72 @@
+import time
+from typing import Any, List, Optional
+import numpy as np
+import faiss
+from langchain_core.embeddings import Embeddings
+
+class SemanticCache:
+    """
+    In-memory cache that returns a stored result when a new topic is
+    worded differently but means the same as an earlier one
+    """
+
+    def __init__(self, embeddings: Embeddings, threshold: float = 0.92,
+                 max_entries: int = 1000, ttl: int = 3600):
+        self.embeddings = embeddings
+        # Minimum cosine similarity for two topics to count as the same
+        self.threshold = threshold
+        # Oldest entries are dropped beyond max_entries, and any entry after ttl seconds
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._index = None
+        self._vectors: List[np.ndarray] = []
+        self._payloads: List[Any] = []
+        self._added_at: List[float] = []
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        # Inner product of unit vectors is their cosine similarity
+        vector = np.asarray([embedding], dtype='float32')
+        faiss.normalize_L2(vector)
+        return vector
+
+    def embed(self, text: str) -> np.ndarray:
+        return self._normalize(self.embeddings.embed_query(text))
+
+    async def aembed(self, text: str) -> np.ndarray:
+        return self._normalize(await self.embeddings.aembed_query(text))
+
+    def _evict(self):
+        """Drop expired entries and the oldest ones over max_entries, rebuilding the index"""
+        cutoff = time.monotonic() - self.ttl
+        keep = [i for i, added_at in enumerate(self._added_at) if added_at >= cutoff]
+        keep = keep[-self.max_entries:]
+        if len(keep) == len(self._payloads):
+            return
+        self._vectors = [self._vectors[i] for i in keep]
+        self._payloads = [self._payloads[i] for i in keep]
+        self._added_at = [self._added_at[i] for i in keep]
+        self._index.reset()
+        if self._vectors:
+            self._index.add(np.vstack(self._vectors))
+
+    def lookup(self, vector: np.ndarray) -> Optional[Any]:
+        """Return the payload of the most similar stored topic above the threshold"""
+        if self._index is None:
+            return None
+        self._evict()
+        if self._index.ntotal == 0:
+            return None
+        scores, ids = self._index.search(vector, 1)
+        if scores[0, 0] >= self.threshold:
+            return self._payloads[ids[0, 0]]
+        return None
+
+    def add(self, vector: np.ndarray, payload: Any):
+        if self._index is None:
+            self._index = faiss.IndexFlatIP(vector.shape[1])
+        self._index.add(vector)
+        self._vectors.append(vector)
+        self._payloads.append(payload)
+        self._added_at.append(time.monotonic())
+        self._evict()
@@ -1,14 +1,24 @@
-from langchain_openai import OpenAI
+from langchain_openai import OpenAI, OpenAIEmbeddings
 from langchain_core.prompts import PromptTemplate
 from dotenv import load_dotenv
+from loguru import logger
+import openai
 import os
 
+from semantic_cache import SemanticCache
+
 # Load environment variables
 load_dotenv()
 
 # Initialize the language model
 llm = OpenAI(openai_api_key=os.getenv('OPENAI_API_KEY'))
 
+# Reuse explanations for topics that are worded differently but mean the same
+semantic_cache = SemanticCache(OpenAIEmbeddings(
+    model='text-embedding-3-small',
+    openai_api_key=os.getenv('OPENAI_API_KEY')
+))
+
 # Create a simple prompt template
 prompt = PromptTemplate(
     input_variables=["topic"],
@@ -16,12 +26,28 @@ prompt = PromptTemplate(
 )
 
 # Create a chain
-def explain_topic(topic):
+def explain_topic(topic, cache_responses=False):
+    # Explanations are sampled at a nonzero temperature, so like
+    # TechContentGenerator they are only reused when the caller opts in
+    topic_vector = None
+    if cache_responses:
+        try:
+            topic_vector = semantic_cache.embed(topic)
+        except openai.APIError as e:
+            # The cache is an optimization; without an embedding the LLM is just called
+            logger.warning(f"Topic embedding failed, skipping semantic cache: {e}")
+    if topic_vector is not None:
+        cached = semantic_cache.lookup(topic_vector)
+        if cached is not None:
+            return cached
+
     # Format the prompt
     formatted_prompt = prompt.format(topic=topic)
     
     # Run the chain
     result = llm.invoke(formatted_prompt)
+    if topic_vector is not None:
+        semantic_cache.add(topic_vector, result)
     
     return result
 
@@ -0,0 +1,631 @@
+import os
+import functools
+import asyncio
+import concurrent.futures
+import threading
+import hashlib
+import json
+import time
+from typing import Dict, Any, List
+from dotenv import load_dotenv
+from loguru import logger
+import httpx
+import diskcache
+
+# Langchain and AI imports
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from langchain_anthropic import ChatAnthropic
+from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.language_models import BaseChatModel
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.runnables import RunnableLambda, RunnableParallel
+from pydantic import BaseModel, Field
+
+# Code formatting
+import subprocess
+import re
+
+# Retry and error handling
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+import anthropic
+import openai
+
+from semantic_cache import SemanticCache
+
+# Load environment variables
+load_dotenv()
+
+# Keep-alive limits for the HTTP connection pool shared by the OpenAI models
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=600)
+
+# Maximum concurrent requests per provider, shared by every caller
+PROVIDER_LIMITS = {
+    ChatOpenAI: 10,
+    ChatAnthropic: 5,
+    ChatGoogleGenerativeAI: 5,
+    OpenAIEmbeddings: 10,
+}
+
+# Transient provider errors are retried, honoring Retry-After; any other
+# provider error, or a transient one that outlasts the retries, goes to the backup model
+RETRYABLE_ERRORS = (
+    anthropic.RateLimitError,
+    anthropic.APIConnectionError,
+    anthropic.InternalServerError,
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+FALLBACK_ERRORS = (anthropic.APIError, openai.APIError)
+
+_backoff = wait_exponential_jitter(initial=4, max=10)
+
+# Longest Retry-After delay honored, so one request cannot stall the UI for minutes
+MAX_RETRY_AFTER = 30
+
+def wait_retry_after(retry_state):
+    """Wait as long as the provider's Retry-After header asks, else back off exponentially with jitter"""
+    error = retry_state.outcome.exception()
+    response = getattr(error, 'response', None)
+    retry_after = response.headers.get('retry-after') if response is not None else None
+    try:
+        return min(float(retry_after), MAX_RETRY_AFTER)
+    except (TypeError, ValueError):
+        return _backoff(retry_state)
+
+# Minimum seconds between streamed updates; each one re-sends the whole text so far
+STREAM_UPDATE_INTERVAL = 0.25
+
+# Static system prompts shared by the streaming, structured and batch paths
+RESEARCH_SYSTEM_PROMPT = "You are a technical research expert. Provide comprehensive insights."
+CREATIVE_SYSTEM_PROMPT = "You are a creative technical writer. Develop engaging content."
+CODE_SYSTEM_PROMPT = "You are an expert programmer. Generate a practical code example related to the topic."
+
+RESEARCH_USER_PROMPT = "Research and analyze the technical aspects of: {topic}"
+CREATIVE_USER_PROMPT = "Develop a detailed blog post based on this research: {research}"
+CODE_USER_PROMPT = "Create a Python code example for this topic: {topic}. Provide a complete, runnable code snippet with comments explaining its purpose and functionality."
+BLOG_CODE_USER_PROMPT = "Create a code example related to this blog content: {blog_content}"
+
+def _run_ruff(args: List[str], code: str) -> str:
+    """Run a ruff command on code passed through stdin"""
+    return subprocess.run(
+        ["ruff", *args, "-"],
+        input=code,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+
+@functools.lru_cache(maxsize=256)
+def _format_cached(code: str) -> str:
+    """Sort imports and format with ruff, memoized so identical snippets are formatted once"""
+    code = _run_ruff(["check", "--select", "I", "--fix", "--exit-zero", "--quiet"], code)
+    return _run_ruff(["format", "--line-length", "88"], code)
+
+def format_code(code: str, language: str = 'python') -> str:
+    """Format and optimize code"""
+    try:
+        if language.lower() == 'python':
+            return _format_cached(code)
+        return code
+    except Exception as e:
+        logger.error(f"Code formatting error: {e}")
+        return code
+
+class LLMCache:
+    """Disk-backed cache of model responses keyed on model, messages and temperature"""
+
+    def __init__(self, directory: str = ".llm_cache", ttl: int = 3600):
+        self._cache = diskcache.Cache(directory)
+        self.ttl = ttl
+
+    @staticmethod
+    def is_cacheable(model: BaseChatModel, allow_stochastic: bool = False) -> bool:
+        # Responses sampled with temperature > 0 are only reused on request
+        return allow_stochastic or not model.temperature
+
+    @staticmethod
+    def make_key(model: BaseChatModel, messages) -> str:
+        payload = {
+            "model": getattr(model, 'model_name', None) or getattr(model, 'model', None),
+            "messages": [(message.type, message.content) for message in messages],
+            "temperature": model.temperature
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+    def get(self, key: str):
+        return self._cache.get(key)
+
+    def set(self, key: str, value):
+        self._cache.set(key, value, expire=self.ttl)
+
+class TechContentGenerator:
+    # Fenced code block or <code> markers, matched in a single pass
+    _CODE_RE = re.compile(r'```(?:python)?\n(.*?)```|<code>(.*?)</code>', re.DOTALL)
+
+    def __init__(self):
+        # Reuse responses for repeated prompts
+        self.cache = LLMCache()
+
+        # Single connection pools so OpenAI calls reuse TCP/TLS connections
+        self._http = httpx.AsyncClient(limits=HTTP_LIMITS)
+        self._http_sync = httpx.Client(limits=HTTP_LIMITS)
+
+        # Async clients are bound to the event loop they first run on, so all
+        # coroutines of this generator run on one long-lived loop (see submit)
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name="tech-generator-loop", daemon=True).start()
+
+        # Per-provider asyncio semaphores, created on the generator's loop on first use
+        self._semaphores = {}
+
+        # Initialize specialized models; the primary models leave retrying
+        # to generate_with_retry, so the SDKs' own retries are disabled
+        self.research_model = ChatOpenAI(
+            model='gpt-4-turbo',
+            temperature=0.3,
+            max_tokens=800,
+            max_retries=0,
+            api_key=os.getenv('OPENAI_API_KEY'),
+            http_client=self._http_sync,
+            http_async_client=self._http
+        )
+        
+        self.creative_model = ChatAnthropic(
+            model='claude-2.1',
+            temperature=0.7,
+            max_tokens=1200,
+            max_retries=0,
+            api_key=os.getenv('ANTHROPIC_API_KEY')
+        )
+        
+        self.backup_model = ChatGoogleGenerativeAI(
+            model='gemini-pro',
+            temperature=0.5,
+            max_output_tokens=1200,
+            api_key=os.getenv('GEMINI_API_KEY')
+        )
+        
+        self.code_model = ChatOpenAI(
+            model='gpt-3.5-turbo',
+            temperature=0.2,
+            max_tokens=1000,
+            max_retries=0,
+            api_key=os.getenv('OPENAI_API_KEY'),
+            http_client=self._http_sync,
+            http_async_client=self._http
+        )
+
+        # Topics worded differently but meaning the same reuse earlier results
+        self.semantic_cache = SemanticCache(OpenAIEmbeddings(
+            model='text-embedding-3-small',
+            api_key=os.getenv('OPENAI_API_KEY'),
+            http_client=self._http_sync,
+            http_async_client=self._http
+        ))
+
+        # Prompt templates are built once; only the variables are bound per call,
+        # which also keeps the serialized system messages identical between calls
+        self._research_tpl = ChatPromptTemplate.from_messages([
+            ("system", RESEARCH_SYSTEM_PROMPT),
+            ("human", RESEARCH_USER_PROMPT)
+        ])
+        self._creative_tpl = ChatPromptTemplate.from_messages([
+            ("system", CREATIVE_SYSTEM_PROMPT),
+            ("human", CREATIVE_USER_PROMPT)
+        ])
+        self._code_tpl = ChatPromptTemplate.from_messages([
+            ("system", CODE_SYSTEM_PROMPT),
+            ("human", CODE_USER_PROMPT)
+        ])
+        self._blog_code_tpl = ChatPromptTemplate.from_messages([
+            ("system", CODE_SYSTEM_PROMPT),
+            ("human", BLOG_CODE_USER_PROMPT)
+        ])
+
+    def submit(self, coro) -> concurrent.futures.Future:
+        """Schedule a coroutine on the generator's event loop from any thread"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def close(self):
+        """Close the shared HTTP connection pools and stop the event loop"""
+        self.submit(self._http.aclose()).result()
+        self._http_sync.close()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+    class BlogPostStructure(BaseModel):
+        """Structured output for blog post generation"""
+        title: str = Field(description="Catchy and informative blog post title")
+        introduction: str = Field(description="Engaging introduction to the topic")
+        key_sections: list[str] = Field(description="Main sections of the blog post")
+        conclusion: str = Field(description="Summarizing conclusion")
+
+    class CodeExample(BaseModel):
+        """Structured output for code generation"""
+        language: str = Field(description="Programming language for the code")
+        purpose: str = Field(description="Brief description of the code's purpose")
+        code: str = Field(description="Actual code implementation")
+        explanation: str = Field(description="Detailed explanation of the code")
+
+    @retry(
+        retry=retry_if_exception_type(RETRYABLE_ERRORS),
+        stop=stop_after_attempt(3),
+        wait=wait_retry_after,
+        reraise=True
+    )
+    async def _call_primary(self, prompt, model, stream_callback=None):
+        """
+        Call the primary model, retrying rate limits and transient errors
+        after the provider's Retry-After delay or an exponential backoff
+        """
+        async with self._provider_slot(model):
+            if stream_callback:
+                result = None
+                last_update = time.monotonic()
+                async for chunk in model.astream(prompt):
+                    result = chunk if result is None else result + chunk
+                    if time.monotonic() - last_update >= STREAM_UPDATE_INTERVAL:
+                        stream_callback(result.content)
+                        last_update = time.monotonic()
+                if result is not None:
+                    stream_callback(result.content)
+                return result
+            return await model.ainvoke(prompt)
+
+    async def generate_with_retry(self, prompt_template, model, inputs, stream_callback=None, cache_responses=False):
+        """
+        Generate with the primary model, falling back to the backup model
+        on provider errors that retrying did not resolve
+        When stream_callback is given, tokens are streamed and the callback
+        receives the accumulated text as it grows
+        """
+        prompt = prompt_template.invoke(inputs)
+
+        cache_key = None
+        if LLMCache.is_cacheable(model, cache_responses):
+            cache_key = LLMCache.make_key(model, prompt.to_messages())
+            # diskcache does blocking SQLite I/O, so it runs in a worker thread
+            cached = await asyncio.to_thread(self.cache.get, cache_key)
+            if cached is not None:
+                logger.info("Using cached model response")
+                if stream_callback:
+                    stream_callback(cached.content)
+                return cached
+
+        try:
+            result = await self._call_primary(prompt, model, stream_callback)
+            if cache_key is not None:
+                await asyncio.to_thread(self.cache.set, cache_key, result)
+            return result
+        except FALLBACK_ERRORS as e:
+            logger.warning(f"Primary model failed: {e}. Attempting backup model...")
+            try:
+                async with self._provider_slot(self.backup_model):
+                    result = await (prompt_template | self.backup_model).ainvoke(inputs)
+                # Replace any partial text streamed before the primary model failed
+                if stream_callback:
+                    stream_callback(result.content)
+                return result
+            except Exception as backup_error:
+                logger.error(f"Backup model also failed: {backup_error}")
+                raise
+
+    def _provider_slot(self, model) -> asyncio.Semaphore:
+        """Semaphore limiting concurrent requests to the model's provider"""
+        provider = type(model)
+        if provider not in self._semaphores:
+            self._semaphores[provider] = asyncio.Semaphore(PROVIDER_LIMITS[provider])
+        return self._semaphores[provider]
+
+    def extract_code_block(self, model_output: str) -> str:
+        """
+        Extract code block from model output using multiple strategies
+        """
+        # Strategies 1 and 2: Look for triple backtick code blocks or code between specific markers
+        code_match = self._CODE_RE.search(model_output)
+        if code_match:
+            return code_match.group(code_match.lastindex).strip()
+        
+        # Strategy 3: Use the entire output if it looks like code
+        if model_output.strip().startswith('def ') or model_output.strip().startswith('import '):
+            return model_output.strip()
+        
+        # Fallback: Return a default example
+        return "# No code could be extracted\ndef example_function():\n    pass"
+
+    async def generate_technical_content(self, topic: str, progress_callback=None, log_callback=None, stream_callback=None, cache_responses=False) -> Dict[str, Any]:
+        """
+        Collaborative process to generate a technical blog post with code example
+        """
+        # Parallel stages report progress independently, so serialize the callbacks
+        progress_lock = threading.Lock()
+
+        # Logging helper
+        def log_and_progress(message, percent=None):
+            with progress_lock:
+                if log_callback:
+                    log_callback(message)
+                if progress_callback and percent is not None:
+                    progress_callback(percent, message)
+                logger.info(message)
+
+        # Progress after the first and second parallel branch finish, in whichever order
+        branch_progress = [50, 65]
+
+        def report_completion(message):
+            """Pass-through step that reports when a parallel branch finishes"""
+            async def _report(output):
+                with progress_lock:
+                    percent = branch_progress.pop(0)
+                log_and_progress(message, percent)
+                return output
+            return RunnableLambda(_report)
+
+        def branch(prompt_template, model):
+            """Parallel branch with its own retry, fallback and cache"""
+            async def _generate(inputs):
+                return await self.generate_with_retry(
+                    prompt_template, model, inputs, cache_responses=cache_responses
+                )
+            return RunnableLambda(_generate)
+
+        # A similar enough earlier topic short-circuits the whole pipeline
+        topic_vector = None
+        if cache_responses:
+            try:
+                async with self._provider_slot(self.semantic_cache.embeddings):
+                    topic_vector = await self.semantic_cache.aembed(topic)
+            except FALLBACK_ERRORS as e:
+                # The cache is an optimization; without an embedding the pipeline just runs
+                logger.warning(f"Topic embedding failed, skipping semantic cache: {e}")
+        if topic_vector is not None:
+            cached_result = self.semantic_cache.lookup(topic_vector)
+            if cached_result is not None:
+                if stream_callback:
+                    stream_callback(cached_result['blog_structure'])
+                log_and_progress("Using cached content for a similar topic", 100)
+                return cached_result
+
+        # Stage 1: Research and Topic Exploration
+        log_and_progress(f"Starting research phase for topic: {topic}", 0)
+        
+        # Research is streamed so the user sees output before the stage completes;
+        # the following stages need the complete research, so they still wait for it
+        blog_structure = await self.generate_with_retry(
+            self._research_tpl, self.research_model, {"topic": topic},
+            stream_callback=stream_callback, cache_responses=cache_responses
+        )
+        
+        log_and_progress("Research phase completed", 25)
+
+        # Stages 2 and 3 are independent of each other, so run them in parallel
+        log_and_progress("Starting creative content development and code example generation", 25)
+
+        # Stage 2: Creative Content Development
+        creative_chain = (
+            branch(self._creative_tpl, self.creative_model)
+            | report_completion("Creative content development completed")
+        )
+
+        # Stage 3: Code Example Generation
+        code_chain = (
+            branch(self._code_tpl, self.code_model)
+            | StrOutputParser()
+            | report_completion("Code example generation completed")
+        )
+
+        # Each branch retries and falls back on its own, so a failure in one
+        # does not discard or repeat the other's finished call
+        parallel = RunnableParallel(creative=creative_chain, code=code_chain)
+        parallel_output = await parallel.ainvoke({"research": blog_structure.content, "topic": topic})
+        full_blog_content = parallel_output['creative']
+        code_example_text = parallel_output['code']
+
+        # Stage 4: Code Extraction and Formatting
+        log_and_progress("Extracting and formatting code", 75)
+        # ruff runs as a subprocess, so formatting is kept off the event loop
+        result = await asyncio.to_thread(
+            self._combine_outputs, blog_structure.content, full_blog_content.content, code_example_text
+        )
+        log_and_progress("Content generation completed", 100)
+
+        if topic_vector is not None:
+            self.semantic_cache.add(topic_vector, result)
+        return result
+
+    def _combine_outputs(self, blog_structure: str, blog_content: str, code_example_text: str) -> Dict[str, Any]:
+        """Extract and format the code example and combine all outputs"""
+        extracted_code = self.extract_code_block(code_example_text)
+        formatted_code = format_code(extracted_code)
+
+        return {
+            'blog_structure': blog_structure,
+            'blog_content': blog_content,
+            'code_example': {
+                'original': extracted_code,
+                'formatted': formatted_code,
+                'language': 'python',
+                'explanation': 'Code example generated for the given topic'
+            }
+        }
+
+    def generate_structured_content(self, topic: str) -> Dict[str, Any]:
+        """
+        Sequential variant where research and code use native structured output
+        and the code example builds on the finished blog post
+        """
+        # The models' SDK retries are disabled, so transient errors are retried here
+        retry_options = dict(retry_if_exception_type=RETRYABLE_ERRORS, stop_after_attempt=3)
+
+        # Stage 1: Research and Topic Exploration
+        # Native structured output: the schema is enforced by the API, not the prompt
+        research_chain = (
+            self._research_tpl | self.research_model.with_structured_output(self.BlogPostStructure)
+        ).with_retry(**retry_options)
+        blog_structure = research_chain.invoke({"topic": topic}).model_dump_json(indent=2)
+
+        # Stage 2: Creative Content Development
+        creative_chain = (self._creative_tpl | self.creative_model).with_retry(**retry_options)
+        full_blog_content = creative_chain.invoke({"research": blog_structure})
+
+        # Stage 3: Code Example Generation
+        code_chain = (
+            self._blog_code_tpl | self.code_model.with_structured_output(self.CodeExample)
+        ).with_retry(**retry_options)
+        code_example = code_chain.invoke({"blog_content": full_blog_content.content})
+
+        # Stage 4: Code Formatting and Optimization
+        formatted_code = format_code(code_example.code, code_example.language)
+
+        return {
+            'blog_structure': blog_structure,
+            'blog_content': full_blog_content.content,
+            'code_example': {
+                'original': code_example.code,
+                'formatted': formatted_code,
+                'language': code_example.language,
+                'explanation': code_example.explanation
+            }
+        }
+
+    async def generate_technical_content_batch(self, topics: List[str], poll_interval: float = 60) -> List[Dict[str, Any]]:
+        """
+        Generate content for many topics through the OpenAI and Anthropic batch APIs.
+        Batched requests cost half as much but may take up to 24 hours,
+        so this is meant for bulk, non-interactive jobs.
+        Uses its own API clients, so it can run on any event loop (e.g. via asyncio.run).
+        Returns one entry per topic: the generated content, or {'topic', 'error'}
+        when one of that topic's batch requests failed.
+        """
+        # Research and code prompts only depend on the topic, so they share one OpenAI batch
+        openai_requests = []
+        for index, topic in enumerate(topics):
+            openai_requests.append(self._openai_batch_request(
+                f"research-{index}", self.research_model,
+                RESEARCH_SYSTEM_PROMPT, RESEARCH_USER_PROMPT.format(topic=topic)
+            ))
+            openai_requests.append(self._openai_batch_request(
+                f"code-{index}", self.code_model,
+                CODE_SYSTEM_PROMPT, CODE_USER_PROMPT.format(topic=topic)
+            ))
+        async with openai.AsyncOpenAI(api_key=os.getenv('OPENAI_API_KEY')) as openai_client:
+            openai_results = await self._run_openai_batch(openai_client, openai_requests, poll_interval)
+
+        # Only topics whose research came back can move on to the creative stage
+        creative_requests = [
+            {
+                "custom_id": f"creative-{index}",
+                "params": {
+                    "model": self.creative_model.model,
+                    "max_tokens": self.creative_model.max_tokens,
+                    "temperature": self.creative_model.temperature,
+                    "system": CREATIVE_SYSTEM_PROMPT,
+                    "messages": [{
+                        "role": "user",
+                        "content": CREATIVE_USER_PROMPT.format(research=openai_results[f"research-{index}"])
+                    }]
+                }
+            }
+            for index in range(len(topics))
+            if f"research-{index}" in openai_results
+        ]
+        creative_results = {}
+        if creative_requests:
+            async with anthropic.AsyncAnthropic(api_key=os.getenv('ANTHROPIC_API_KEY')) as anthropic_client:
+                creative_results = await self._run_anthropic_batch(anthropic_client, creative_requests, poll_interval)
+
+        outputs = []
+        for index, topic in enumerate(topics):
+            missing = [
+                stage for stage, results in (
+                    ("research", openai_results), ("creative", creative_results), ("code", openai_results)
+                )
+                if f"{stage}-{index}" not in results
+            ]
+            if missing:
+                outputs.append({'topic': topic, 'error': f"Batch requests failed: {', '.join(missing)}"})
+                continue
+            outputs.append(await asyncio.to_thread(
+                self._combine_outputs,
+                openai_results[f"research-{index}"],
+                creative_results[f"creative-{index}"],
+                openai_results[f"code-{index}"]
+            ))
+        return outputs
+
+    @staticmethod
+    def _openai_batch_request(custom_id: str, model: ChatOpenAI, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
+        """One JSONL line of an OpenAI chat completions batch"""
+        return {
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": model.model_name,
+                "temperature": model.temperature,
+                "max_tokens": model.max_tokens,
+                "messages": [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ]
+            }
+        }
+
+    async def _run_openai_batch(self, client, requests, poll_interval: float) -> Dict[str, str]:
+        """Upload requests as a JSONL batch, wait for it to finish and return the replies by custom_id"""
+        payload = "\n".join(json.dumps(request) for request in requests).encode()
+        batch_file = await client.files.create(file=("batch.jsonl", payload), purpose="batch")
+        batch = await client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info(f"Submitted OpenAI batch {batch.id} with {len(requests)} requests")
+
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(poll_interval)
+            batch = await client.batches.retrieve(batch.id)
+        if batch.status != "completed":
+            # Expired and cancelled batches still return the requests that finished
+            logger.warning(f"OpenAI batch {batch.id} ended with status {batch.status}")
+
+        results = {}
+        if batch.output_file_id:
+            output = await client.files.content(batch.output_file_id)
+            for line in output.text.splitlines():
+                record = json.loads(line)
+                if record.get("response") and record["response"]["status_code"] == 200:
+                    results[record["custom_id"]] = record["response"]["body"]["choices"][0]["message"]["content"]
+
+        self._check_batch_results(batch.id, requests, results)
+        return results
+
+    async def _run_anthropic_batch(self, client, requests, poll_interval: float) -> Dict[str, str]:
+        """Submit a Message Batch, wait for it to finish and return the replies by custom_id"""
+        batch = await client.messages.batches.create(requests=requests)
+        logger.info(f"Submitted Anthropic batch {batch.id} with {len(requests)} requests")
+
+        while batch.processing_status != "ended":
+            await asyncio.sleep(poll_interval)
+            batch = await client.messages.batches.retrieve(batch.id)
+
+        results = {}
+        async for entry in await client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                results[entry.custom_id] = entry.result.message.content[0].text
+
+        self._check_batch_results(batch.id, requests, results)
+        return results
+
+    @staticmethod
+    def _check_batch_results(batch_id: str, requests, results: Dict[str, str]):
+        """Log requests without a reply; the caller reports them per topic"""
+        failed = [request["custom_id"] for request in requests if request["custom_id"] not in results]
+        if failed:
+            logger.error(f"Batch {batch_id} requests failed: {failed}")
+
+@functools.lru_cache(maxsize=1)
+def get_generator() -> TechContentGenerator:
+    """Process-wide generator shared by every entry point"""
+    return TechContentGenerator()